@@ -2,57 +2,124 @@
 """Minimal local adapter example for privy-cli.
 
 Replace `detect_entities` with your real local model call.
+
+Protocol: UTF-8 JSON, both directions. Each stdin line is a JSON object
+``{"text": "..."}``; for each one the adapter writes a ``{"entities": [...]}``
+line to stdout and flushes. Read ``sys.stdin.buffer``, not text-mode
+``sys.stdin``: the latter decodes with the locale encoding (e.g. cp1250 on a
+Czech Windows machine), which garbles non-ASCII text and shifts every returned
+offset after it. This serves both the default one-shot mode (one request, then
+EOF) and ``privy anonymize --model-persistent``, which keeps one adapter
+process alive for the whole document.
+
+Set ``PRIVY_ADAPTER_HYPERSCAN=1`` (with ``python-hyperscan`` installed) to
+compile all demo patterns into one Hyperscan database used as a prefilter: a
+single pass over ASCII text tells which patterns can match, and only those
+run through ``re``, which still produces every span. Non-ASCII text always
+goes straight to ``re``, because Hyperscan's word classes are ASCII-only.
+Compiling takes ~150 ms, so this only pays off for a long-running adapter
+serving many lines; by default the adapter uses ``re`` alone.
 """
 
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
 
+try:
+    import hyperscan
+except ImportError:  # optional accelerator
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+# Demo-only patterns, compiled once per process.
+_PERSON_RE = re.compile(r"\b[A-Z][a-z]+\s+[A-Z][a-z]+\b")
+_COMPANY_RE = re.compile(r"\b(?:[A-Z][\w&.-]*\s+){0,3}[A-Z][\w&.-]*\s(?:Inc|LLC|Ltd|Corp)\b")
+_ADDRESS_RE = re.compile(
+    r"\b\d{1,5}\s+[A-Z][A-Za-z0-9.'-]*(?:\s+[A-Z][A-Za-z0-9.'-]*){0,5}\s(?:Street|St|Road|Rd|Avenue|Ave)\b"
+)
+
+_PATTERNS: list[tuple[re.Pattern[str], str, float]] = [
+    (_PERSON_RE, "PERSON", 0.7),
+    (_COMPANY_RE, "COMPANY", 0.8),
+    (_ADDRESS_RE, "ADDRESS", 0.8),
+]
+
+
+def _build_hyperscan_database():
+    if hyperscan is None or os.environ.get("PRIVY_ADAPTER_HYPERSCAN") != "1":
+        return None, None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pattern.pattern.encode("ascii") for pattern, _, _ in _PATTERNS],
+        ids=list(range(len(_PATTERNS))),
+        elements=len(_PATTERNS),
+        # Only "does pattern N match anywhere" is needed, so one report per pattern.
+        flags=hyperscan.HS_FLAG_SINGLEMATCH,
+    )
+    return db, hyperscan.Scratch(db)
+
+
+_HS_DB, _HS_SCRATCH = _build_hyperscan_database()
+
+# Python's \s also matches these ASCII controls while Hyperscan's does not.
+_RE_ONLY_WHITESPACE = re.compile(r"[\x0b\x1c-\x1f]")
+
+
+def _candidate_patterns(text: str) -> list[tuple[re.Pattern[str], str, float]]:
+    """Return the patterns that can match *text*; spans always come from ``re``."""
+    if _HS_DB is None or not text.isascii() or _RE_ONLY_WHITESPACE.search(text):
+        return _PATTERNS
+
+    matched: set[int] = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+        matched.add(pattern_id)
+
+    # On such text Hyperscan and re agree on whether each pattern matches.
+    _HS_DB.scan(text.encode("ascii"), match_event_handler=on_match, scratch=_HS_SCRATCH)
+    return [entry for pattern_id, entry in enumerate(_PATTERNS) if pattern_id in matched]
+
 
 def detect_entities(text: str) -> list[dict[str, object]]:
     entities: list[dict[str, object]] = []
 
-    # Demo-only patterns
-    for match in re.finditer(r"\b[A-Z][a-z]+\s+[A-Z][a-z]+\b", text):
-        entities.append(
-            {
-                "start": match.start(),
-                "end": match.end(),
-                "label": "PERSON",
-                "confidence": 0.7,
-            }
-        )
-
-    for match in re.finditer(r"\b(?:[A-Z][\w&.-]*\s+){0,3}[A-Z][\w&.-]*\s(?:Inc|LLC|Ltd|Corp)\b", text):
-        entities.append(
-            {
-                "start": match.start(),
-                "end": match.end(),
-                "label": "COMPANY",
-                "confidence": 0.8,
-            }
-        )
-
-    for match in re.finditer(r"\b\d{1,5}\s+[A-Z][A-Za-z0-9.'-]*(?:\s+[A-Z][A-Za-z0-9.'-]*){0,5}\s(?:Street|St|Road|Rd|Avenue|Ave)\b", text):
-        entities.append(
-            {
-                "start": match.start(),
-                "end": match.end(),
-                "label": "ADDRESS",
-                "confidence": 0.8,
-            }
-        )
+    for pattern, label, confidence in _candidate_patterns(text):
+        for match in pattern.finditer(text):
+            entities.append(
+                {
+                    "start": match.start(),
+                    "end": match.end(),
+                    "label": label,
+                    "confidence": confidence,
+                }
+            )
 
     return entities
 
 
 def main() -> int:
-    payload = json.load(sys.stdin)
-    text = payload.get("text", "")
-    out = {"entities": detect_entities(text)}
-    json.dump(out, sys.stdout)
+    # One JSON request per line (NDJSON), one JSON response line each, so a
+    # single process can serve many texts. A lone request without a trailing
+    # newline still works as a one-shot call. Requests are UTF-8 bytes,
+    # whatever the locale encoding is.
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        payload = orjson.loads(line) if orjson is not None else json.loads(line)
+        text = payload.get("text", "")
+        out = {"entities": detect_entities(text)}
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(out) + b"\n")
+        else:
+            sys.stdout.buffer.write(json.dumps(out).encode("utf-8") + b"\n")
+        sys.stdout.flush()
     return 0
 
 
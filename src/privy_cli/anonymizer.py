@@ -1,16 +1,31 @@
 from __future__ import annotations
 
-import json
+import re
+import sys
+from bisect import bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
 from docx import Document
 
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator, installed with the "fast" extra
+    ahocorasick = None
+
 from .detector import BaseDetector
-from .docx_engine import apply_replacements_to_paragraph, iter_document_paragraphs, paragraph_text
+from .docx_engine import (
+    ParagraphRef,
+    apply_replacements_to_paragraph,
+    iter_document_paragraphs,
+    paragraph_text,
+)
+from .jsonio import dumps_pretty
 from .mapping_store import MappingData, read_mapping, write_mapping
-from .types import SpanReplacement, VALID_ENTITY_TYPES
+from .types import EntitySpan, SpanReplacement, VALID_ENTITY_TYPES
 
 
 class AnonymizationError(RuntimeError):
@@ -31,6 +46,14 @@ _LEGAL_ROLE_WORDS = frozenset({
 })
 
 
+# Cheap per-paragraph gates: a paragraph that cannot contain any enabled
+# entity type is never sent to the detector.
+_NAME_ENTITY_TYPES = frozenset({"PERSON", "COMPANY", "ADDRESS"})
+_DIGIT_ENTITY_TYPES = frozenset({"PHONE", "DOC_ID", "NATIONAL_ID", "ADDRESS"})
+_LETTER_RE = re.compile(r"[^\W\d_]")
+_DIGIT_RE = re.compile(r"\d")
+
+
 @dataclass
 class ProcessingReport:
     paragraphs_scanned: int
@@ -61,17 +84,32 @@ def anonymize_docx(
     reverse_index: dict[tuple[str, str], str] = {}
     counters = {entity_type: 0 for entity_type in normalized_entity_types}
 
-    paragraphs_scanned = 0
+    paragraphs: list[tuple[ParagraphRef, str]] = []
+    for paragraph_ref in iter_document_paragraphs(doc):
+        text = paragraph_text(paragraph_ref.paragraph)
+        if text.strip():
+            paragraphs.append((paragraph_ref, text))
+
+    # Detection is independent per paragraph; placeholders are assigned
+    # afterwards in document order so numbering stays deterministic.
+    candidates = [
+        idx
+        for idx, (_, text) in enumerate(paragraphs)
+        if _may_contain_entities(text, normalized_entity_types)
+    ]
+    detected: list[list[EntitySpan]] = [[] for _ in paragraphs]
+    for idx, raw_entities in zip(candidates, detector.detect_batch([paragraphs[idx][1] for idx in candidates])):
+        detected[idx] = raw_entities
+
+    paragraphs_scanned = len(paragraphs)
     replacements_applied = 0
     entities_detected = 0
 
-    for paragraph_ref in iter_document_paragraphs(doc):
-        text = paragraph_text(paragraph_ref.paragraph)
-        if not text.strip():
-            continue
+    # Local aliases for the per-entity loop below.
+    placeholders = mapping.placeholders
+    find_placeholder = reverse_index.get
 
-        paragraphs_scanned += 1
-        raw_entities = detector.detect(text)
+    for (paragraph_ref, text), raw_entities in zip(paragraphs, detected):
         entities = _select_entities(raw_entities, normalized_entity_types, min_confidence)
         if not entities:
             continue
@@ -80,15 +118,17 @@ def anonymize_docx(
 
         replacements: list[SpanReplacement] = []
         for entity in entities:
+            label = entity.label
             original = text[entity.start : entity.end]
-            key = (entity.label, original)
-            placeholder = reverse_index.get(key)
+            key = (label, original)
+            placeholder = find_placeholder(key)
             if placeholder is None:
-                counters[entity.label] += 1
-                placeholder = f"{entity.label}_{counters[entity.label]:03d}"
+                count = counters[label] + 1
+                counters[label] = count
+                placeholder = sys.intern(f"{label}_{count:03d}")
                 reverse_index[key] = placeholder
-                mapping.placeholders[placeholder] = {
-                    "label": entity.label,
+                placeholders[placeholder] = {
+                    "label": label,
                     "original": original,
                 }
             replacements.append(
@@ -110,7 +150,7 @@ def anonymize_docx(
 
     if report_path is not None:
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+        report_path.write_bytes(dumps_pretty(report.to_dict()))
 
     return report
 
@@ -126,6 +166,7 @@ def deanonymize_docx(
         raise AnonymizationError("Mapping has no placeholders. Nothing to deanonymize.")
 
     doc = Document(str(input_path))
+    match_placeholders = _build_placeholder_matcher(_sorted_placeholders(mapping))
 
     paragraphs_scanned = 0
     replacements_applied = 0
@@ -137,7 +178,7 @@ def deanonymize_docx(
             continue
 
         paragraphs_scanned += 1
-        replacements = _placeholder_replacements(text, mapping)
+        replacements = _placeholder_replacements(text, match_placeholders)
         if not replacements:
             continue
 
@@ -155,7 +196,7 @@ def deanonymize_docx(
 
     if report_path is not None:
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+        report_path.write_bytes(dumps_pretty(report.to_dict()))
 
     return report
 
@@ -169,7 +210,7 @@ def _normalize_entity_types(entity_types: Iterable[str]) -> set[str]:
                 f"Unsupported entity type: {entity_type}. "
                 f"Valid values: {', '.join(sorted(VALID_ENTITY_TYPES))}."
             )
-        normalized.add(value)
+        normalized.add(sys.intern(value))
 
     if not normalized:
         raise AnonymizationError("At least one entity type must be provided.")
@@ -177,6 +218,18 @@ def _normalize_entity_types(entity_types: Iterable[str]) -> set[str]:
     return normalized
 
 
+def _may_contain_entities(text: str, entity_types: set[str]) -> bool:
+    """Return False if *text* cannot hold any of *entity_types* (no '@', digit or capitalised word)."""
+    if "EMAIL" in entity_types and "@" in text:
+        return True
+    if not _DIGIT_ENTITY_TYPES.isdisjoint(entity_types) and _DIGIT_RE.search(text):
+        return True
+    # islower() is False for text with any uppercase letter, and for scripts without case.
+    if not _NAME_ENTITY_TYPES.isdisjoint(entity_types) and not text.islower() and _LETTER_RE.search(text):
+        return True
+    return False
+
+
 def _select_entities(
     entities: list[EntitySpan],
     entity_types: set[str],
@@ -199,32 +252,73 @@ def _select_entities(
         key=lambda e: (-e.confidence, -(e.end - e.start), e.start),
     )
 
+    # Selected spans never overlap, so keeping them ordered by start means a
+    # candidate can only collide with its two neighbours.
     selected: list[EntitySpan] = []
+    selected_starts: list[int] = []
     for candidate in ranked:
-        if any(_overlaps(candidate.start, candidate.end, current.start, current.end) for current in selected):
+        idx = bisect_right(selected_starts, candidate.start)
+        if idx > 0 and selected[idx - 1].end > candidate.start:
+            continue
+        if idx < len(selected) and selected[idx].start < candidate.end:
             continue
-        selected.append(candidate)
+        selected_starts.insert(idx, candidate.start)
+        selected.insert(idx, candidate)
 
-    return sorted(selected, key=lambda e: e.start)
+    return selected
 
 
-def _placeholder_replacements(text: str, mapping: MappingData) -> list[SpanReplacement]:
-    matches: list[tuple[int, int, str]] = []
-    sorted_placeholders = sorted(mapping.placeholders.items(), key=lambda item: len(item[0]), reverse=True)
+def _sorted_placeholders(mapping: MappingData) -> tuple[tuple[str, str], ...]:
+    """Return ``(placeholder, original)`` pairs, longest placeholder first."""
+    pairs = [
+        (placeholder, metadata["original"])
+        for placeholder, metadata in mapping.placeholders.items()
+        if metadata.get("original")
+    ]
+    pairs.sort(key=lambda item: len(item[0]), reverse=True)
+    return tuple(pairs)
 
-    for placeholder, metadata in sorted_placeholders:
-        original = metadata.get("original")
-        if not original:
-            continue
 
-        start = 0
-        while True:
-            idx = text.find(placeholder, start)
-            if idx == -1:
-                break
-            matches.append((idx, idx + len(placeholder), original))
-            start = idx + len(placeholder)
+def _build_placeholder_matcher(
+    placeholders: tuple[tuple[str, str], ...],
+) -> Callable[[str], Iterable[tuple[int, int, str]]]:
+    """Return a function yielding ``(start, end, original)`` for placeholder hits in a text.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise a
+    single compiled alternation; either way each text is scanned once.
+    """
+    if not placeholders:
+        return lambda text: ()
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for placeholder, original in placeholders:
+            automaton.add_word(placeholder, (len(placeholder), original))
+        automaton.make_automaton()
+
+        def match_automaton(text: str) -> Iterable[tuple[int, int, str]]:
+            # Reports every (possibly overlapping) hit.
+            for end, (length, original) in automaton.iter(text):
+                yield end - length + 1, end + 1, original
+
+        return match_automaton
 
+    originals = dict(placeholders)
+    # Alternatives are tried in order, so longest-first wins at each position.
+    pattern = re.compile("|".join(re.escape(placeholder) for placeholder, _ in placeholders))
+
+    def match_pattern(text: str) -> Iterable[tuple[int, int, str]]:
+        for match in pattern.finditer(text):
+            yield match.start(), match.end(), originals[match.group()]
+
+    return match_pattern
+
+
+def _placeholder_replacements(
+    text: str,
+    match_placeholders: Callable[[str], Iterable[tuple[int, int, str]]],
+) -> list[SpanReplacement]:
+    matches = list(match_placeholders(text))
     if not matches:
         return []
 
@@ -241,13 +335,12 @@ def _placeholder_replacements(text: str, mapping: MappingData) -> list[SpanRepla
     return replacements
 
 
+@lru_cache(maxsize=4096)
 def _is_legal_role_label(text: str) -> bool:
     """Return True if *text* is a legal document role label like 'THE CONSULTANT'."""
+    if len(text) < 5:  # shorter than "THE X"
+        return False
     upper = text.strip().upper()
     if not upper.startswith("THE "):
         return False
     return upper[4:].strip() in _LEGAL_ROLE_WORDS
-
-
-def _overlaps(start_a: int, end_a: int, start_b: int, end_b: int) -> bool:
-    return start_a < end_b and start_b < end_a
@@ -5,8 +5,17 @@ from typing import Optional
 
 import typer
 
-from .anonymizer import AnonymizationError, anonymize_docx, deanonymize_docx
-from .detector import DetectorError, available_detectors, build_detector, validate_command_detector, validate_gliner_detector
+# anonymizer (and with it python-docx) is imported inside the commands that
+# need it, so --help, `models list` and the GUI launch don't pay for it.
+from .detector import (
+    DEFAULT_GLINER_BATCH_SIZE,
+    DEFAULT_GLINER_DEVICE,
+    DetectorError,
+    available_detectors,
+    build_detector,
+    validate_command_detector,
+    validate_gliner_detector,
+)
 
 app = typer.Typer(
     help="Local AI CLI for reversible DOCX anonymization.",
@@ -58,12 +67,36 @@ def anonymize_command(
         envvar="PRIVY_MODEL_CMD",
         help="Local model command returning JSON entities for a text payload.",
     ),
+    model_persistent: bool = typer.Option(
+        False,
+        "--model-persistent",
+        help="Keep the --model-cmd process running and send one JSON line per paragraph.",
+    ),
+    model_workers: int = typer.Option(
+        1,
+        "--model-workers",
+        min=1,
+        help="Run up to this many --model-cmd processes in parallel (one-shot mode only).",
+    ),
     gliner_model: Optional[str] = typer.Option(
         None,
         "--gliner-model",
         envvar="PRIVY_GLINER_MODEL",
         help="GLiNER model name or path. Defaults to urchade/gliner_large-v2.1.",
     ),
+    gliner_batch_size: int = typer.Option(
+        DEFAULT_GLINER_BATCH_SIZE,
+        "--gliner-batch-size",
+        envvar="PRIVY_GLINER_BATCH",
+        min=1,
+        help="Paragraphs per GLiNER inference batch.",
+    ),
+    gliner_device: str = typer.Option(
+        DEFAULT_GLINER_DEVICE,
+        "--gliner-device",
+        envvar="PRIVY_GLINER_DEVICE",
+        help="Torch device for GLiNER inference: cpu, cuda, cuda:N or mps.",
+    ),
     entity_type: list[str] = typer.Option(
         ["PERSON", "COMPANY", "ADDRESS", "EMAIL", "PHONE", "DOC_ID", "NATIONAL_ID"],
         "--entity-type",
@@ -81,10 +114,25 @@ def anonymize_command(
         typer.echo("Output path must use .docx extension.", err=True)
         raise typer.Exit(1)
 
+    if model_persistent and model_workers > 1:
+        typer.echo("--model-workers cannot be combined with --model-persistent, which uses one process.", err=True)
+        raise typer.Exit(1)
+
+    from .anonymizer import AnonymizationError, anonymize_docx
+
     resolved_map_path = _resolve_map_path(map_path, output_docx)
 
+    detector_impl = None
     try:
-        detector_impl = build_detector(detector=detector, model_cmd=model_cmd, gliner_model=gliner_model)
+        detector_impl = build_detector(
+            detector=detector,
+            model_cmd=model_cmd,
+            gliner_model=gliner_model,
+            gliner_batch_size=gliner_batch_size,
+            gliner_device=gliner_device,
+            model_persistent=model_persistent,
+            model_workers=model_workers,
+        )
         report = anonymize_docx(
             input_path=input_docx,
             output_path=output_docx,
@@ -97,6 +145,9 @@ def anonymize_command(
     except (DetectorError, AnonymizationError, OSError, ValueError) as exc:
         typer.echo(f"Anonymization failed: {exc}", err=True)
         raise typer.Exit(1)
+    finally:
+        if detector_impl is not None:
+            detector_impl.close()
 
     typer.echo(f"Anonymized document: {output_docx}")
     typer.echo(f"Mapping: {resolved_map_path}")
@@ -123,6 +174,8 @@ def deanonymize_command(
         typer.echo("Output path must use .docx extension.", err=True)
         raise typer.Exit(1)
 
+    from .anonymizer import AnonymizationError, deanonymize_docx
+
     try:
         report = deanonymize_docx(
             input_path=input_docx,
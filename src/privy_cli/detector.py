@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import json
+import functools
+import queue
 import re
 import shlex
 import subprocess
@@ -9,11 +10,14 @@ import threading
 import time
 import warnings
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from collections.abc import Callable
 from typing import Any
 
+from . import jsonio
 from .types import EntitySpan, VALID_ENTITY_TYPES
 
 LABEL_ALIASES = {
@@ -50,6 +54,11 @@ GLINER_LABEL_MAP: dict[str, str] = {
     "ADDRESS": "location",
 }
 
+# Paragraphs per GLiNER forward pass in GlinerDetector.detect_batch().
+DEFAULT_GLINER_BATCH_SIZE = 16
+# Torch device for GLiNER inference ("cpu", "cuda", "cuda:1", "mps", ...).
+DEFAULT_GLINER_DEVICE = "cpu"
+
 
 class DetectorError(RuntimeError):
     pass
@@ -154,40 +163,62 @@ class BaseDetector(ABC):
     def detect(self, text: str) -> list[EntitySpan]:
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Release external resources (e.g. a model subprocess). Safe to call twice."""
+
+    def detect_batch(self, texts: list[str]) -> list[list[EntitySpan]]:
+        """Detect entities in several texts; result ``i`` belongs to ``texts[i]``.
+
+        Backends with a per-call fixed cost should override this.
+        """
+        return [self.detect(text) for text in texts]
+
 
 @dataclass
 class CommandDetector(BaseDetector):
+    """Run an external model command that speaks JSON over stdin/stdout.
+
+    The protocol is UTF-8 JSON, both directions, regardless of the locale:
+    adapters must read stdin as bytes (``sys.stdin.buffer`` in Python), as the
+    entity offsets they return index the decoded text.
+
+    By default the command is started once per text: it receives a single
+    ``{"text": "..."}`` object on stdin and must print ``{"entities": [...]}``
+    (or a bare list) before exiting.
+
+    With ``persistent=True`` the command is started once and kept alive. Each
+    request is one JSON object followed by a newline, and the command must
+    answer every request line with exactly one JSON response line, flushing
+    stdout after each. See ``examples/model_adapter_example.py``.
+
+    ``workers > 1`` runs up to that many one-shot commands concurrently in
+    ``detect_batch``; persistent mode always uses its single process.
+    """
+
     command: str
     timeout_seconds: int = 30
+    persistent: bool = False
+    workers: int = 1
+    _proc: subprocess.Popen[bytes] | None = field(default=None, init=False, repr=False, compare=False)
+    _responses: queue.Queue[bytes | None] | None = field(default=None, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def detect(self, text: str) -> list[EntitySpan]:
         if not text.strip():
             return []
 
-        args = shlex.split(self.command)
-        payload = json.dumps({"text": text}, ensure_ascii=False)
-
-        proc = subprocess.run(
-            args,
-            input=payload,
-            text=True,
-            capture_output=True,
-            timeout=self.timeout_seconds,
-            check=False,
-        )
-
-        if proc.returncode != 0:
-            raise DetectorError(
-                "Model command failed "
-                f"(exit={proc.returncode}): {proc.stderr.strip() or 'no stderr'}"
-            )
+        payload = jsonio.dumps({"text": text})
+        if self.persistent:
+            stdout = self._request(payload)
+        else:
+            stdout = self._run_once(payload)
 
         try:
-            model_output = json.loads(proc.stdout)
-        except json.JSONDecodeError as exc:
+            model_output = jsonio.loads(stdout)
+        except ValueError as exc:
             raise DetectorError(
                 "Model command must return JSON. "
-                f"Got: {proc.stdout[:200]!r}"
+                f"Got: {stdout[:200].decode('utf-8', 'replace')!r}"
             ) from exc
 
         entities_raw: Any
@@ -211,6 +242,99 @@ class CommandDetector(BaseDetector):
 
         return sorted(entities, key=lambda e: (e.start, e.end))
 
+    def detect_batch(self, texts: list[str]) -> list[list[EntitySpan]]:
+        if self.persistent or self.workers <= 1 or len(texts) < 2:
+            return super().detect_batch(texts)
+        # Threads only wait on the child processes, so the GIL is not a bottleneck.
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(texts))) as pool:
+            return list(pool.map(self.detect, texts))
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_process()
+
+    def __del__(self) -> None:
+        self._stop_process()
+
+    def _run_once(self, payload: bytes) -> bytes:
+        args = shlex.split(self.command)
+        proc = subprocess.run(
+            args,
+            input=payload,
+            capture_output=True,
+            timeout=self.timeout_seconds,
+            check=False,
+        )
+
+        if proc.returncode != 0:
+            raise DetectorError(
+                "Model command failed "
+                f"(exit={proc.returncode}): {proc.stderr.decode('utf-8', 'replace').strip() or 'no stderr'}"
+            )
+        return proc.stdout
+
+    def _request(self, payload: bytes) -> bytes:
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start_process()
+            assert self._proc is not None and self._proc.stdin is not None and self._responses is not None
+            try:
+                self._proc.stdin.write(payload + b"\n")
+                self._proc.stdin.flush()
+                line = self._responses.get(timeout=self.timeout_seconds)
+            except BrokenPipeError:
+                line = None
+            except queue.Empty:
+                self._stop_process()
+                raise DetectorError(
+                    f"Model command did not answer within {self.timeout_seconds} seconds."
+                ) from None
+
+            if line is None:
+                # EOF can arrive before the child is reaped; _stop_process() waits for it.
+                proc = self._proc
+                self._stop_process()
+                raise DetectorError(
+                    "Model command exited before answering "
+                    f"(exit={proc.returncode}); persistent mode needs one JSON response line per request line."
+                )
+            return line
+
+    def _start_process(self) -> None:
+        self._stop_process()
+        # stderr is inherited so adapter logs stay visible and can't fill a pipe.
+        self._proc = subprocess.Popen(
+            shlex.split(self.command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._responses = queue.Queue()
+        threading.Thread(
+            target=_pump_lines,
+            args=(self._proc.stdout, self._responses),
+            daemon=True,
+        ).start()
+
+    def _stop_process(self) -> None:
+        proc, self._proc, self._responses = self._proc, None, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+
+def _pump_lines(stream: Any, responses: queue.Queue[bytes | None]) -> None:
+    """Forward response lines from a persistent model command; ``None`` marks EOF."""
+    for line in stream:
+        if line.strip():
+            responses.put(line)
+    responses.put(None)
+
 
 @dataclass
 class HeuristicDetector(BaseDetector):
@@ -235,6 +359,53 @@ class HeuristicDetector(BaseDetector):
         return sorted(entities, key=lambda e: (e.start, e.end))
 
 
+class CachingDetector(BaseDetector):
+    """Wrap a detector and reuse its results for texts it has already seen.
+
+    Documents repeat paragraph text (signature blocks, disclaimers, the same
+    heading in every unlinked section header); each distinct text is
+    detected once. Entries are keyed by the text itself and evicted
+    least-recently-used.
+    """
+
+    def __init__(self, inner: BaseDetector, max_entries: int = 1024) -> None:
+        self.inner = inner
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, list[EntitySpan]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def detect(self, text: str) -> list[EntitySpan]:
+        return self.detect_batch([text])[0]
+
+    def detect_batch(self, texts: list[str]) -> list[list[EntitySpan]]:
+        with self._lock:
+            found = {text: self._cache_get(text) for text in texts}
+        misses = [text for text, entities in found.items() if entities is None]
+        if misses:
+            for text, entities in zip(misses, self.inner.detect_batch(misses)):
+                found[text] = entities
+            with self._lock:
+                for text in misses:
+                    self._cache_put(text, found[text])
+        # Fresh lists, so callers may mutate their result without touching the cache.
+        return [list(found[text]) for text in texts]
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def _cache_get(self, text: str) -> list[EntitySpan] | None:
+        entities = self._cache.get(text)
+        if entities is not None:
+            self._cache.move_to_end(text)
+        return entities
+
+    def _cache_put(self, text: str, entities: list[EntitySpan]) -> None:
+        self._cache[text] = entities
+        self._cache.move_to_end(text)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+
 def _get_default_models_dir() -> Path:
     """Return the default directory for GLiNER model cache.
 
@@ -247,6 +418,10 @@ def _get_default_models_dir() -> Path:
     return Path(__file__).resolve().parent.parent.parent / "models"
 
 
+_GLINER_MODELS: dict[tuple[str, str, str], Any] = {}
+_GLINER_MODELS_LOCK = threading.Lock()
+
+
 class GlinerDetector(BaseDetector):
     def __init__(
         self,
@@ -254,9 +429,13 @@ class GlinerDetector(BaseDetector):
         threshold: float = 0.5,
         models_dir: Path | None = None,
         progress_callback: Callable[[str], None] | None = None,
+        batch_size: int = DEFAULT_GLINER_BATCH_SIZE,
+        device: str = DEFAULT_GLINER_DEVICE,
     ) -> None:
         self.model_name = model_name
         self.threshold = threshold
+        self.batch_size = max(1, batch_size)
+        self.device = device.strip().lower() or DEFAULT_GLINER_DEVICE
         try:
             from gliner import GLiNER
         except ModuleNotFoundError as exc:
@@ -264,69 +443,79 @@ class GlinerDetector(BaseDetector):
                 "Missing dependency 'gliner'. Install it with: pip install gliner"
             ) from exc
 
-        def _report(msg: str) -> None:
-            if progress_callback:
-                progress_callback(msg)
-
         local_dir = (models_dir or _get_default_models_dir()) / model_name.replace("/", "--")
-        if (local_dir / "gliner_config.json").exists():
-            _report("Loading AI model...")
-            spinner = _Spinner("Loading model...")
-            spinner.start()
-            try:
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    self._model = GLiNER.from_pretrained(str(local_dir))
-            finally:
-                spinner.stop("Model loaded")
-        else:
-            _report("Downloading AI model (one-time setup, ~1.5 GB)...")
-            _echo(
-                f"Downloading GLiNER model ({model_name})\n"
-                "First run — this is a one-time download and may take a few minutes."
-            )
-            spinner = _Spinner("Downloading model...")
-            spinner.start()
-            try:
-                local_dir.mkdir(parents=True, exist_ok=True)
-                # Intercept stderr to capture tqdm progress for the GUI
-                original_stderr = sys.stderr
-                if progress_callback and original_stderr is not None:
-                    sys.stderr = _ProgressInterceptor(original_stderr, _report)  # type: ignore[assignment]
-                try:
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore")
-                        self._model = GLiNER.from_pretrained(model_name)
-                finally:
-                    sys.stderr = original_stderr
-                _report("Saving model to local cache...")
-                spinner.update("Saving model to local cache...")
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    self._model.save_pretrained(str(local_dir))
-            except (OSError, ConnectionError) as exc:
-                spinner.stop()
-                _report("Model download failed. Check your internet connection.")
-                raise DetectorError(
-                    f"Failed to download GLiNER model: {exc}\n"
-                    "Check your internet connection and try again, or use "
-                    "--detector heuristic for pattern-based detection (no download required)."
-                ) from exc
-            spinner.stop(f"Model ready — cached at {local_dir}")
-            _report("Model ready")
+        # Models are shared process-wide: loading one takes seconds and
+        # hundreds of MB, and detectors never mutate it.
+        key = (model_name, str(local_dir), self.device)
+        with _GLINER_MODELS_LOCK:
+            model = _GLINER_MODELS.get(key)
+            if model is None:
+                model = _load_gliner_model(GLiNER, model_name, local_dir, progress_callback)
+                if self.device != "cpu":
+                    model = _move_to_device(model, self.device)
+                _GLINER_MODELS[key] = model
+        self._model = model
 
     _email_re = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
     _phone_re = re.compile(r"(?<!\w)\+?\d{1,3}[\s.-]?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{3,4}(?!\w)")
     _doc_id_re = re.compile(r"\b[A-Z]{2,}[-/]\d{3,}(?:[-/][A-Z0-9]+)*\b")
     _national_id_re = re.compile(r"\b\d{6}[/-]\d{3,4}\b")
+    _digit_re = re.compile(r"\d")
 
     def detect(self, text: str) -> list[EntitySpan]:
         if not text.strip():
             return []
+        if not self._needs_model(text):
+            return self._to_entities(text, [])
 
         gliner_labels = list(GLINER_LABEL_MAP.values())
         raw_entities = self._model.predict_entities(text, gliner_labels, threshold=self.threshold)
+        return self._to_entities(text, raw_entities)
+
+    def detect_batch(self, texts: list[str]) -> list[list[EntitySpan]]:
+        batch_predict = self._batch_predictor()
+        if batch_predict is None:
+            return super().detect_batch(texts)
 
+        results: list[list[EntitySpan]] = [[] for _ in texts]
+        pending: list[int] = []
+        for idx, text in enumerate(texts):
+            if not text.strip():
+                continue
+            if self._needs_model(text):
+                pending.append(idx)
+            else:
+                results[idx] = self._to_entities(text, [])
+        gliner_labels = list(GLINER_LABEL_MAP.values())
+        for offset in range(0, len(pending), self.batch_size):
+            chunk = pending[offset : offset + self.batch_size]
+            raw_batches = batch_predict([texts[idx] for idx in chunk], gliner_labels, threshold=self.threshold)
+            for idx, raw_entities in zip(chunk, raw_batches):
+                results[idx] = self._to_entities(texts[idx], raw_entities)
+        return results
+
+    def _batch_predictor(self) -> Callable[..., list[list[dict[str, Any]]]] | None:
+        """Return the model's batched prediction call, or None if it has none.
+
+        Current GLiNER releases batch through ``inference``; their deprecated
+        ``batch_predict_entities`` forwards there with a fixed ``batch_size=8``,
+        which would split every chunk. Old releases (0.2.5) only have
+        ``batch_predict_entities``, which takes no ``batch_size``.
+        """
+        inference = getattr(self._model, "inference", None)
+        if inference is not None:
+            return functools.partial(inference, batch_size=self.batch_size)
+        return getattr(self._model, "batch_predict_entities", None)
+
+    def _needs_model(self, text: str) -> bool:
+        """Return False for text GLiNER won't find a name, organization or location in.
+
+        Such text has no capital letter and no digit. islower() is False for
+        caseless scripts, so those still go to the model.
+        """
+        return not text.islower() or self._digit_re.search(text) is not None
+
+    def _to_entities(self, text: str, raw_entities: list[dict[str, Any]]) -> list[EntitySpan]:
         # Use GLiNER for PERSON, COMPANY, ADDRESS only — regex handles the rest.
         _regex_handled = {"PHONE", "EMAIL", "DOC_ID", "NATIONAL_ID"}
         entities: list[EntitySpan] = []
@@ -355,6 +544,78 @@ class GlinerDetector(BaseDetector):
         return sorted(entities, key=lambda e: (e.start, e.end))
 
 
+def _load_gliner_model(
+    gliner_cls: Any,
+    model_name: str,
+    local_dir: Path,
+    progress_callback: Callable[[str], None] | None,
+) -> Any:
+    """Load *model_name* from *local_dir*, downloading and caching it there on first use."""
+
+    def _report(msg: str) -> None:
+        if progress_callback:
+            progress_callback(msg)
+
+    if (local_dir / "gliner_config.json").exists():
+        _report("Loading AI model...")
+        spinner = _Spinner("Loading model...")
+        spinner.start()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                model = gliner_cls.from_pretrained(str(local_dir))
+        finally:
+            spinner.stop("Model loaded")
+    else:
+        _report("Downloading AI model (one-time setup, ~1.5 GB)...")
+        _echo(
+            f"Downloading GLiNER model ({model_name})\n"
+            "First run — this is a one-time download and may take a few minutes."
+        )
+        spinner = _Spinner("Downloading model...")
+        spinner.start()
+        try:
+            local_dir.mkdir(parents=True, exist_ok=True)
+            # Intercept stderr to capture tqdm progress for the GUI
+            original_stderr = sys.stderr
+            if progress_callback and original_stderr is not None:
+                sys.stderr = _ProgressInterceptor(original_stderr, _report)  # type: ignore[assignment]
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    model = gliner_cls.from_pretrained(model_name)
+            finally:
+                sys.stderr = original_stderr
+            _report("Saving model to local cache...")
+            spinner.update("Saving model to local cache...")
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                model.save_pretrained(str(local_dir))
+        except (OSError, ConnectionError) as exc:
+            spinner.stop()
+            _report("Model download failed. Check your internet connection.")
+            raise DetectorError(
+                f"Failed to download GLiNER model: {exc}\n"
+                "Check your internet connection and try again, or use "
+                "--detector heuristic for pattern-based detection (no download required)."
+            ) from exc
+        spinner.stop(f"Model ready — cached at {local_dir}")
+        _report("Model ready")
+    return model
+
+
+def _move_to_device(model: Any, device: str) -> Any:
+    try:
+        return model.to(device)
+    except (RuntimeError, AssertionError) as exc:
+        # torch raises RuntimeError for unknown/unavailable devices and
+        # AssertionError when it was built without CUDA.
+        raise DetectorError(
+            f"Cannot run GLiNER on device '{device}': {exc}\n"
+            "Use --gliner-device cpu, or install a torch build that supports this device."
+        ) from exc
+
+
 def available_detectors() -> list[str]:
     return ["gliner", "command", "heuristic"]
 
@@ -364,6 +625,10 @@ def build_detector(
     model_cmd: str | None,
     gliner_model: str | None = None,
     progress_callback: Callable[[str], None] | None = None,
+    gliner_batch_size: int = DEFAULT_GLINER_BATCH_SIZE,
+    model_persistent: bool = False,
+    gliner_device: str = DEFAULT_GLINER_DEVICE,
+    model_workers: int = 1,
 ) -> BaseDetector:
     detector_name = detector.strip().lower()
     if detector_name == "heuristic":
@@ -371,12 +636,17 @@ def build_detector(
     if detector_name == "command":
         if not model_cmd:
             raise DetectorError("--model-cmd is required when detector is 'command'.")
-        return CommandDetector(command=model_cmd)
+        # Model-backed detectors are slow per text; the regex heuristic is not worth caching.
+        command = CommandDetector(command=model_cmd, persistent=model_persistent, workers=model_workers)
+        return CachingDetector(command)
     if detector_name == "gliner":
-        return GlinerDetector(
+        gliner = GlinerDetector(
             model_name=gliner_model or "urchade/gliner_large-v2.1",
             progress_callback=progress_callback,
+            batch_size=gliner_batch_size,
+            device=gliner_device,
         )
+        return CachingDetector(gliner)
     raise DetectorError(f"Unsupported detector type: {detector}")
 
 
@@ -392,14 +662,8 @@ def validate_gliner_detector(gliner_model: str | None = None) -> None:
 
 def _from_pattern(pattern: re.Pattern[str], text: str, label: str, confidence: float) -> list[EntitySpan]:
     return [
-        EntitySpan(
-            start=match.start(),
-            end=match.end(),
-            label=label,
-            text=match.group(0),
-            confidence=confidence,
-        )
-        for match in pattern.finditer(text)
+        EntitySpan(start=start, end=end, label=label, text=text[start:end], confidence=confidence)
+        for start, end in map(re.Match.span, pattern.finditer(text))
     ]
 
 
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import Iterable
 
 from docx.document import Document as DocxDocument
+from lxml import etree
 from docx.table import _Cell, Table
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
@@ -14,14 +17,22 @@ _W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 _W_R = f"{{{_W_NS}}}r"
 _W_HYPERLINK = f"{{{_W_NS}}}hyperlink"
 
+# The run children python-docx's Run.text renders (w:t as text, w:tab as "\t",
+# w:br as "\n", ...), for direct and hyperlinked runs, in document order.
+_RUN_CONTENT = "*[self::w:t or self::w:tab or self::w:br or self::w:cr or self::w:noBreakHyphen or self::w:ptab]"
+_PARAGRAPH_CONTENT_XPATH = etree.XPath(
+    f"./w:r/{_RUN_CONTENT} | ./w:hyperlink/w:r/{_RUN_CONTENT}",
+    namespaces={"w": _W_NS},
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ParagraphRef:
     paragraph: Paragraph
     location: str
 
 
-def _all_runs(paragraph: Paragraph) -> list[Run]:
+def paragraph_runs(paragraph: Paragraph) -> list[Run]:
     """Return all Run objects in document order, including those inside hyperlinks."""
     runs: list[Run] = []
     for child in paragraph._element:
@@ -34,6 +45,21 @@ def _all_runs(paragraph: Paragraph) -> list[Run]:
 
 
 def iter_document_paragraphs(doc: DocxDocument) -> Iterable[ParagraphRef]:
+    """Yield every paragraph of the document once, with its location.
+
+    A header/footer linked to the previous section and a merged table cell
+    reach the same ``<w:p>`` more than once; only the first is yielded.
+    """
+    # Holding the elements keeps their lxml proxies alive, so identity is stable.
+    seen: set[etree._Element] = set()
+    for paragraph_ref in _iter_paragraph_refs(doc):
+        element = paragraph_ref.paragraph._element
+        if element not in seen:
+            seen.add(element)
+            yield paragraph_ref
+
+
+def _iter_paragraph_refs(doc: DocxDocument) -> Iterable[ParagraphRef]:
     for idx, paragraph in enumerate(doc.paragraphs):
         yield ParagraphRef(paragraph=paragraph, location=f"body:{idx}")
 
@@ -41,74 +67,85 @@ def iter_document_paragraphs(doc: DocxDocument) -> Iterable[ParagraphRef]:
         yield from _iter_table_paragraphs(table, prefix=f"body-table:{t_idx}")
 
     for s_idx, section in enumerate(doc.sections):
-        for idx, paragraph in enumerate(section.header.paragraphs):
-            yield ParagraphRef(paragraph=paragraph, location=f"section:{s_idx}:header:{idx}")
-        for t_idx, table in enumerate(section.header.tables):
-            yield from _iter_table_paragraphs(table, prefix=f"section:{s_idx}:header-table:{t_idx}")
-
-        for idx, paragraph in enumerate(section.footer.paragraphs):
-            yield ParagraphRef(paragraph=paragraph, location=f"section:{s_idx}:footer:{idx}")
-        for t_idx, table in enumerate(section.footer.tables):
-            yield from _iter_table_paragraphs(table, prefix=f"section:{s_idx}:footer-table:{t_idx}")
+        for part_name, part in (("header", section.header), ("footer", section.footer)):
+            prefix = f"section:{s_idx}:{part_name}"
+            for idx, paragraph in enumerate(part.paragraphs):
+                yield ParagraphRef(paragraph=paragraph, location=f"{prefix}:{idx}")
+            for t_idx, table in enumerate(part.tables):
+                yield from _iter_table_paragraphs(table, prefix=f"{prefix}-table:{t_idx}")
 
 
 def paragraph_text(paragraph: Paragraph) -> str:
-    return "".join(run.text for run in _all_runs(paragraph))
+    """Return the text of all runs, including hyperlinked ones, exactly as ``Run.text`` renders it."""
+    # One XPath call instead of a Run wrapper and an XPath per run; the
+    # elements' __str__ does the same tab/break translation as Run.text.
+    return "".join(map(str, _PARAGRAPH_CONTENT_XPATH(paragraph._element)))
 
 
-def apply_replacements_to_paragraph(paragraph: Paragraph, replacements: list[SpanReplacement]) -> int:
+def apply_replacements_to_paragraph(
+    paragraph: Paragraph,
+    replacements: list[SpanReplacement],
+) -> int:
     if not replacements:
         return 0
 
-    runs = _all_runs(paragraph)
-    run_bounds = []
-    cursor = 0
-    for run in runs:
-        text = run.text
-        length = len(text)
-        run_bounds.append((run, cursor, cursor + length))
-        cursor += length
-
-    if not run_bounds:
+    runs = paragraph_runs(paragraph)
+    if not runs:
         return 0
 
-    changed = 0
-    for replacement in sorted(replacements, key=lambda r: (r.start, r.end), reverse=True):
-        if replacement.end <= replacement.start:
-            continue
-
-        overlaps: list[tuple[object, int, int]] = []
-        for run, run_start, run_end in run_bounds:
-            if run_start < replacement.end and run_end > replacement.start:
-                overlaps.append((run, run_start, run_end))
+    # Run.text re-walks the run's XML on every access, so read each run once.
+    run_texts = [run.text for run in runs]
+    # run_ends[i] is the paragraph offset where runs[i] stops, run_starts[i] where it begins.
+    run_ends = list(accumulate(map(len, run_texts)))
+    run_starts = [0, *run_ends[:-1]]
 
-        if not overlaps:
+    # Collect each run's edits first, then rebuild every touched run once.
+    run_edits: dict[int, list[tuple[int, int, str]]] = {}
+    changed = 0
+    last_end = 0
+    for replacement in sorted(replacements, key=lambda r: (r.start, r.end)):
+        if replacement.end <= replacement.start or replacement.start < last_end:
             continue
+        last_end = replacement.end
 
-        first = True
-        for run, run_start, run_end in overlaps:
-            run_text = run.text
+        lo = bisect_right(run_ends, replacement.start)
+        hi = bisect_left(run_starts, replacement.end)
+        for idx in range(lo, hi):
+            run_start = run_starts[idx]
             local_start = max(replacement.start, run_start) - run_start
-            local_end = min(replacement.end, run_end) - run_start
-            insert_text = replacement.replacement if first else ""
-            new_text = run_text[:local_start] + insert_text + run_text[local_end:]
-            if new_text != run_text:
-                run.text = new_text
+            local_end = min(replacement.end, run_ends[idx]) - run_start
+            # The replacement text goes into the first run; the rest of the span is cut.
+            insert_text = replacement.replacement if idx == lo else ""
+            if run_texts[idx][local_start:local_end] != insert_text:
+                run_edits.setdefault(idx, []).append((local_start, local_end, insert_text))
                 changed += 1
-            first = False
+
+    for idx, edits in run_edits.items():
+        run_text = run_texts[idx]
+        parts: list[str] = []
+        cursor = 0
+        for local_start, local_end, insert_text in edits:
+            parts.append(run_text[cursor:local_start])
+            parts.append(insert_text)
+            cursor = local_end
+        parts.append(run_text[cursor:])
+        runs[idx].text = "".join(parts)
 
     return changed
 
 
 def _iter_table_paragraphs(table: Table, prefix: str) -> Iterable[ParagraphRef]:
     for r_idx, row in enumerate(table.rows):
+        row_prefix = f"{prefix}:r{r_idx}c"
         for c_idx, cell in enumerate(row.cells):
-            yield from _iter_cell_paragraphs(cell, prefix=f"{prefix}:r{r_idx}c{c_idx}")
+            yield from _iter_cell_paragraphs(cell, prefix=f"{row_prefix}{c_idx}")
 
 
 def _iter_cell_paragraphs(cell: _Cell, prefix: str) -> Iterable[ParagraphRef]:
+    paragraph_prefix = f"{prefix}:p"
     for p_idx, paragraph in enumerate(cell.paragraphs):
-        yield ParagraphRef(paragraph=paragraph, location=f"{prefix}:p{p_idx}")
+        yield ParagraphRef(paragraph=paragraph, location=f"{paragraph_prefix}{p_idx}")
 
+    table_prefix = f"{prefix}:table:"
     for t_idx, table in enumerate(cell.tables):
-        yield from _iter_table_paragraphs(table, prefix=f"{prefix}:table:{t_idx}")
+        yield from _iter_table_paragraphs(table, prefix=f"{table_prefix}{t_idx}")
@@ -10,7 +10,8 @@ from pathlib import Path
 
 import webview  # type: ignore[import-untyped]
 
-from .anonymizer import AnonymizationError, anonymize_docx, deanonymize_docx
+# anonymizer (and with it python-docx) is imported inside the operations that
+# need it, so opening the window doesn't wait for it.
 from .detector import BaseDetector, DetectorError, build_detector
 from .gui_html import HTML
 from .types import VALID_ENTITY_TYPES
@@ -39,18 +40,20 @@ class Api:
         )
         if result and len(result) > 0:
             path = str(result[0])
-            if not path.lower().endswith(".docx"):
+            selected = Path(path)
+            if selected.suffix.lower() != ".docx":
                 return {"error": "Please select a .docx file."}
             self._selected_file = path
-            return {"path": path, "name": Path(path).name}
+            return {"path": path, "name": selected.name}
         return {"cancelled": True}
 
     def select_file_via_drop(self, file_path: str) -> dict:
         """Called when user drops a file on the drop zone."""
-        if not file_path.lower().endswith(".docx"):
+        dropped = Path(file_path)
+        if dropped.suffix.lower() != ".docx":
             return {"error": "Please drop a .docx file."}
         self._selected_file = file_path
-        return {"path": file_path, "name": Path(file_path).name}
+        return {"path": file_path, "name": dropped.name}
 
     # ── Core operations ─────────────────────────────────────────────────
 
@@ -75,6 +78,8 @@ class Api:
 
         self._update_status("Anonymizing document...")
 
+        from .anonymizer import AnonymizationError, anonymize_docx
+
         try:
             report = anonymize_docx(
                 input_path=input_path,
@@ -121,6 +126,8 @@ class Api:
 
         self._update_status("Restoring document...")
 
+        from .anonymizer import AnonymizationError, deanonymize_docx
+
         try:
             report = deanonymize_docx(
                 input_path=input_path,
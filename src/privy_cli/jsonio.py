@@ -0,0 +1,32 @@
+"""JSON helpers that use orjson when it is installed and fall back to stdlib json."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, installed with the "fast" extra
+    orjson = None
+
+
+def dumps_pretty(value: Any) -> bytes:
+    """Serialize *value* to UTF-8 JSON indented by two spaces, non-ASCII left unescaped."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize *value* to compact UTF-8 JSON, non-ASCII left unescaped."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from *data*; raises ``ValueError`` (``json.JSONDecodeError`` or invalid UTF-8) on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .jsonio import dumps_pretty, loads
+
 
 class MappingStoreError(RuntimeError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class MappingData:
     placeholders: dict[str, dict[str, str]]
     created_at: str
@@ -20,7 +21,7 @@ class MappingData:
     def create_empty(cls) -> "MappingData":
         return cls(
             placeholders={},
-            created_at=datetime.now(timezone.utc).isoformat(),
+            created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -41,15 +42,15 @@ class MappingData:
 
 def write_mapping(path: Path, mapping: MappingData) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(mapping.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+    path.write_bytes(dumps_pretty(mapping.to_dict()))
 
 
 def read_mapping(path: Path) -> MappingData:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = loads(path.read_bytes())
     except FileNotFoundError as exc:
         raise MappingStoreError(f"Mapping file not found: {path}") from exc
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:  # malformed JSON or invalid UTF-8
         raise MappingStoreError(f"Mapping file is not valid JSON: {path}") from exc
 
     return MappingData.from_dict(payload)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import NamedTuple
 
 VALID_ENTITY_TYPES = {"PERSON", "COMPANY", "ADDRESS", "EMAIL", "PHONE", "DOC_ID", "NATIONAL_ID"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntitySpan:
     start: int
     end: int
@@ -14,8 +15,7 @@ class EntitySpan:
     confidence: float = 1.0
 
 
-@dataclass(frozen=True)
-class SpanReplacement:
+class SpanReplacement(NamedTuple):
     start: int
     end: int
     replacement: str
@@ -0,0 +1,62 @@
+import pytest
+
+from privy_cli import anonymizer
+from privy_cli.mapping_store import MappingData
+from privy_cli.types import EntitySpan, VALID_ENTITY_TYPES
+
+
+@pytest.mark.parametrize("use_automaton", [True, False], ids=["aho-corasick", "regex"])
+def test_placeholder_replacements_prefer_longest_placeholder(
+    monkeypatch: pytest.MonkeyPatch, use_automaton: bool
+) -> None:
+    if use_automaton:
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(anonymizer, "ahocorasick", None)
+
+    mapping = MappingData.create_empty()
+    mapping.placeholders["PERSON_100"] = {"label": "PERSON", "original": "Jane Doe"}
+    mapping.placeholders["PERSON_1000"] = {"label": "PERSON", "original": "John Roe"}
+
+    text = "PERSON_1000 met PERSON_100."
+    match_placeholders = anonymizer._build_placeholder_matcher(anonymizer._sorted_placeholders(mapping))
+
+    replacements = anonymizer._placeholder_replacements(text, match_placeholders)
+
+    assert [(r.start, r.end, r.replacement) for r in replacements] == [
+        (0, 11, "John Roe"),
+        (16, 26, "Jane Doe"),
+    ]
+
+
+def test_select_entities_keeps_best_non_overlapping_spans() -> None:
+    entities = [
+        EntitySpan(start=0, end=8, label="PERSON", text="John Doe", confidence=0.65),
+        EntitySpan(start=0, end=13, label="COMPANY", text="John Doe Corp", confidence=0.85),
+        EntitySpan(start=20, end=35, label="ADDRESS", text="123 Main Street", confidence=0.8),
+        EntitySpan(start=24, end=35, label="PERSON", text="Main Street", confidence=0.65),
+        EntitySpan(start=40, end=60, label="EMAIL", text="jane.doe@example.com", confidence=0.95),
+        EntitySpan(start=61, end=70, label="PHONE", text="555123456", confidence=0.4),
+    ]
+
+    selected = anonymizer._select_entities(entities, VALID_ENTITY_TYPES, min_confidence=0.5)
+
+    assert [(e.start, e.end, e.label) for e in selected] == [
+        (0, 13, "COMPANY"),
+        (20, 35, "ADDRESS"),
+        (40, 60, "EMAIL"),
+    ]
+
+
+def test_may_contain_entities_gates_by_enabled_types() -> None:
+    all_types = set(VALID_ENTITY_TYPES)
+
+    assert anonymizer._may_contain_entities("signed by Jiří Novák", all_types)
+    assert anonymizer._may_contain_entities("call 777 123 456", all_types)
+    assert anonymizer._may_contain_entities("mail jane@example.com", all_types)
+    assert anonymizer._may_contain_entities("签字人 张伟", all_types)
+    assert not anonymizer._may_contain_entities("see the attached terms.", all_types)
+    assert not anonymizer._may_contain_entities("— * —", all_types)
+
+    assert not anonymizer._may_contain_entities("call 777 123 456", {"PERSON"})
+    assert not anonymizer._may_contain_entities("Signed by Jane", {"EMAIL", "PHONE"})
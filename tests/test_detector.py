@@ -0,0 +1,221 @@
+import importlib.util
+import random
+import shlex
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from privy_cli import detector as detector_module
+from privy_cli.detector import BaseDetector, CachingDetector, CommandDetector, DetectorError, GlinerDetector, HeuristicDetector
+from privy_cli.types import EntitySpan
+
+_ADAPTER = Path(__file__).resolve().parent.parent / "examples" / "model_adapter_example.py"
+_ADAPTER_CMD = f"{shlex.quote(sys.executable)} {shlex.quote(str(_ADAPTER))}"
+
+
+class _FakeOldGliner:
+    """Mimics GLiNER 0.2.5, which batches only via batch_predict_entities."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def batch_predict_entities(self, texts, labels, threshold=0.5):
+        self.batches.append(list(texts))
+        return [
+            [{"start": 0, "end": 8, "label": "person", "text": text[:8], "score": 0.9}]
+            for text in texts
+        ]
+
+
+class _FakeGliner(_FakeOldGliner):
+    """Mimics current GLiNER, whose batch_predict_entities is deprecated."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_sizes: list[int] = []
+
+    def inference(self, texts, labels, threshold=0.5, batch_size=8):
+        self.batch_sizes.append(batch_size)
+        return super().batch_predict_entities(texts, labels, threshold=threshold)
+
+    def batch_predict_entities(self, texts, labels, threshold=0.5):
+        raise AssertionError("deprecated; should call inference()")
+
+
+def _gliner_with(model: object, batch_size: int) -> GlinerDetector:
+    # Bypass __init__, which loads (or downloads) the real model.
+    detector = GlinerDetector.__new__(GlinerDetector)
+    detector.model_name = "fake"
+    detector.threshold = 0.5
+    detector.batch_size = batch_size
+    detector._model = model
+    return detector
+
+
+def test_gliner_detect_batch_chunks_texts_and_keeps_order() -> None:
+    model = _FakeGliner()
+    detector = _gliner_with(model, batch_size=2)
+    texts = [
+        "Jane Doe signed.",
+        "   ",
+        "John Roe paid.",
+        "write to jane@example.com",
+        "Anna Nov called jane@example.com.",
+    ]
+
+    results = detector.detect_batch(texts)
+
+    # Blank and all-lowercase, digit-free texts never reach the model.
+    assert model.batches == [[texts[0], texts[2]], [texts[4]]]
+    assert model.batch_sizes == [2, 2]
+    assert results[1] == []
+    assert [(e.label, e.text) for e in results[3]] == [("EMAIL", "jane@example.com")]
+    assert [e.text for e in results[0]] == ["Jane Doe"]
+    assert [(e.label, e.text) for e in results[4]] == [("PERSON", "Anna Nov"), ("EMAIL", "jane@example.com")]
+
+
+def test_gliner_detect_batch_uses_batch_predict_on_old_gliner() -> None:
+    model = _FakeOldGliner()
+    detector = _gliner_with(model, batch_size=2)
+    texts = ["Jane Doe signed.", "John Roe paid.", "Anna Nov called."]
+
+    results = detector.detect_batch(texts)
+
+    assert model.batches == [texts[:2], texts[2:]]
+    assert [e.text for e in results[2]] == ["Anna Nov"]
+
+
+@pytest.mark.parametrize("persistent", [False, True], ids=["one-shot", "persistent"])
+def test_command_detector_with_example_adapter(persistent: bool) -> None:
+    detector = CommandDetector(command=_ADAPTER_CMD, persistent=persistent)
+    try:
+        first = detector.detect("Jane Doe works at Acme LLC.")
+        second = detector.detect("Office: 12 Baker Street.")
+    finally:
+        detector.close()
+
+    assert [(e.label, e.text) for e in first] == [("PERSON", "Jane Doe"), ("COMPANY", "Acme LLC")]
+    assert ("ADDRESS", "12 Baker Street") in [(e.label, e.text) for e in second]
+
+
+@pytest.mark.parametrize("persistent", [False, True], ids=["one-shot", "persistent"])
+def test_command_detector_offsets_ignore_adapter_locale(monkeypatch: pytest.MonkeyPatch, persistent: bool) -> None:
+    # The protocol is UTF-8 both ways, even when the adapter's stdio encoding is not.
+    monkeypatch.setenv("PYTHONIOENCODING", "cp1250")
+    detector = CommandDetector(command=_ADAPTER_CMD, persistent=persistent)
+    try:
+        entities = detector.detect("Smlouva: Jiří Novák, Karel Svoboda podepsal.")
+    finally:
+        detector.close()
+
+    assert [(e.label, e.text) for e in entities] == [("PERSON", "Karel Svoboda")]
+
+
+def test_command_detector_parallel_batch_keeps_order() -> None:
+    texts = ["Jane Doe works at Acme LLC.", "   ", "Office: 12 Baker Street.", "John Roe called."]
+    sequential = CommandDetector(command=_ADAPTER_CMD).detect_batch(texts)
+
+    parallel = CommandDetector(command=_ADAPTER_CMD, workers=3).detect_batch(texts)
+
+    assert parallel == sequential
+    assert parallel[1] == []
+
+
+def test_persistent_command_detector_reuses_one_process() -> None:
+    detector = CommandDetector(command=_ADAPTER_CMD, persistent=True)
+    try:
+        detector.detect("Jane Doe works at Acme LLC.")
+        proc = detector._proc
+        detector.detect("John Roe works at Initech Inc.")
+        assert detector._proc is proc
+    finally:
+        detector.close()
+    assert detector._proc is None
+
+
+def test_persistent_command_detector_reports_early_exit() -> None:
+    command = f"{shlex.quote(sys.executable)} -c 'raise SystemExit(3)'"
+    detector = CommandDetector(command=command, persistent=True)
+
+    with pytest.raises(DetectorError, match=r"exited before answering \(exit=3\)"):
+        detector.detect("Jane Doe works at Acme LLC.")
+
+
+def test_gliner_model_is_loaded_once_per_process(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    loads: list[str] = []
+
+    class _FakeGLiNER:
+        @classmethod
+        def from_pretrained(cls, path: str) -> "_FakeGLiNER":
+            loads.append(path)
+            return cls()
+
+    monkeypatch.setitem(sys.modules, "gliner", types.SimpleNamespace(GLiNER=_FakeGLiNER))
+    monkeypatch.setattr(detector_module, "_GLINER_MODELS", {})
+    local_dir = tmp_path / "org--model"
+    local_dir.mkdir()
+    (local_dir / "gliner_config.json").write_text("{}")
+
+    first = GlinerDetector(model_name="org/model", models_dir=tmp_path)
+    second = GlinerDetector(model_name="org/model", models_dir=tmp_path, threshold=0.7)
+
+    assert loads == [str(local_dir)]
+    assert first._model is second._model
+
+
+class _CountingDetector(BaseDetector):
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+        self.inner = HeuristicDetector()
+
+    def detect(self, text: str) -> list[EntitySpan]:
+        self.seen.append(text)
+        return self.inner.detect(text)
+
+
+def test_caching_detector_detects_each_distinct_text_once() -> None:
+    inner = _CountingDetector()
+    detector = CachingDetector(inner, max_entries=2)
+    header = "Acme LLC confidential"
+
+    results = detector.detect_batch([header, "Jane Doe signed.", header])
+    again = detector.detect(header)
+
+    assert inner.seen == [header, "Jane Doe signed."]
+    assert results[0] == results[2] == again
+    assert results[0] is not results[2]
+
+    detector.detect("John Roe paid.")  # evicts "Jane Doe signed.", the least recently used
+    detector.detect("Jane Doe signed.")
+    assert inner.seen[-2:] == ["John Roe paid.", "Jane Doe signed."]
+
+
+def _load_adapter(monkeypatch: pytest.MonkeyPatch, hyperscan: bool) -> types.ModuleType:
+    monkeypatch.setenv("PRIVY_ADAPTER_HYPERSCAN", "1" if hyperscan else "0")
+    spec = importlib.util.spec_from_file_location(f"_adapter_hs_{hyperscan}", _ADAPTER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_adapter_hyperscan_prefilter_matches_re(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("hyperscan")
+    with_hs = _load_adapter(monkeypatch, hyperscan=True)
+    plain = _load_adapter(monkeypatch, hyperscan=False)
+    assert with_hs._HS_DB is not None and plain._HS_DB is None
+
+    tokens = [
+        "St", "LLC", "Street", "Corp", "Acme", "Road", "Novák", "Strojírny", "Vsetín", "Ltd",
+        "Jane", "Doe", "12", "Baker", "Ave", "Inc", "a&b", "x.y", "\x1c", "\t", " ", "\n", "-",
+    ]
+    rng = random.Random(1234)
+    texts = [
+        "St LLC Street Corp Acme LLC St",
+        "Road Novák",
+        "Strojírny Vsetín Ltd",
+        *(" ".join(rng.choices(tokens, k=rng.randint(1, 12))) for _ in range(3000)),
+    ]
+    for text in texts:
+        assert with_hs.detect_entities(text) == plain.detect_entities(text), text
@@ -4,6 +4,13 @@ from docx import Document
 
 from privy_cli.anonymizer import anonymize_docx, deanonymize_docx
 from privy_cli.detector import HeuristicDetector
+from privy_cli.docx_engine import (
+    apply_replacements_to_paragraph,
+    iter_document_paragraphs,
+    paragraph_runs,
+    paragraph_text,
+)
+from privy_cli.types import SpanReplacement
 
 
 def _document_text(path: Path) -> str:
@@ -72,3 +79,101 @@ def test_legal_role_labels_are_not_anonymized(tmp_path: Path) -> None:
     anonymized_text = _document_text(anonymized_path)
     assert "THE CONSULTANT" in anonymized_text, "Legal role label should not be anonymized"
     assert "PERSON_" in anonymized_text, "Actual person name should be anonymized"
+
+
+def test_replacement_spanning_runs_keeps_first_run_format() -> None:
+    doc = Document()
+    paragraph = doc.add_paragraph()
+    paragraph.add_run("Call ")
+    paragraph.add_run("Ja").bold = True
+    paragraph.add_run("")
+    paragraph.add_run("ne Doe")
+    paragraph.add_run(" or Bob.")
+
+    changed = apply_replacements_to_paragraph(
+        paragraph,
+        [
+            SpanReplacement(start=5, end=13, replacement="PERSON_001"),
+            SpanReplacement(start=17, end=20, replacement="PERSON_002"),
+        ],
+    )
+
+    assert changed == 3
+    assert [run.text for run in paragraph.runs] == ["Call ", "PERSON_001", "", "", " or PERSON_002."]
+    assert paragraph.runs[1].bold is True
+
+
+def test_paragraph_text_matches_run_text_with_tabs_and_breaks() -> None:
+    doc = Document()
+    paragraph = doc.add_paragraph()
+    run = paragraph.add_run("Name:")
+    run.add_tab()
+    run.add_text("Jane Doe")
+    run.add_break()
+    paragraph.add_run("Acme LLC")
+
+    assert paragraph_text(paragraph) == "Name:\tJane Doe\nAcme LLC"
+    assert paragraph_text(paragraph) == "".join(r.text for r in paragraph_runs(paragraph))
+
+
+def test_several_replacements_in_one_run() -> None:
+    doc = Document()
+    paragraph = doc.add_paragraph()
+    paragraph.add_run("Jane Doe and John Roe met Jane Doe.")
+
+    changed = apply_replacements_to_paragraph(
+        paragraph,
+        [
+            SpanReplacement(start=26, end=34, replacement="PERSON_001"),
+            SpanReplacement(start=0, end=8, replacement="PERSON_001"),
+            SpanReplacement(start=13, end=21, replacement="PERSON_002"),
+        ],
+    )
+
+    assert changed == 3
+    assert paragraph.text == "PERSON_001 and PERSON_002 met PERSON_001."
+
+
+def test_linked_section_headers_are_replaced_once(tmp_path: Path) -> None:
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "Confidential for Jane Doe"
+    doc.add_paragraph("John Roe signed first.")
+    for _ in range(2):
+        # New sections inherit ("link to previous") the first section's header.
+        doc.add_section()
+        doc.add_paragraph("More text.")
+
+    input_path = tmp_path / "sections.docx"
+    output_path = tmp_path / "sections_anonymized.docx"
+    restored_path = tmp_path / "sections_restored.docx"
+    map_path = tmp_path / "sections.map.json"
+    doc.save(str(input_path))
+
+    anonymize_report = anonymize_docx(
+        input_path=input_path,
+        output_path=output_path,
+        map_path=map_path,
+        detector=HeuristicDetector(),
+        entity_types=["PERSON"],
+    )
+    deanonymize_report = deanonymize_docx(input_path=output_path, output_path=restored_path, map_path=map_path)
+
+    # The shared header counts once, in both directions.
+    assert anonymize_report.paragraphs_scanned == deanonymize_report.paragraphs_scanned == 4
+    anonymized = Document(str(output_path))
+    assert [p.text for p in anonymized.sections[0].header.paragraphs] == ["Confidential for PERSON_002"]
+    restored = Document(str(restored_path))
+    assert [p.text for p in restored.sections[0].header.paragraphs] == ["Confidential for Jane Doe"]
+
+
+def test_merged_table_cell_paragraph_is_yielded_once() -> None:
+    doc = Document()
+    table = doc.add_table(rows=2, cols=3)
+    merged = table.cell(0, 0).merge(table.cell(1, 2))
+    merged.paragraphs[0].text = "Jane Doe"
+
+    texts = [ref.paragraph.text for ref in iter_document_paragraphs(doc)]
+
+    # row.cells repeats the merged cell six times; vertically merged
+    # continuation cells keep their own empty <w:p>.
+    assert texts.count("Jane Doe") == 1
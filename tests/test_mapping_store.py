@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from privy_cli import jsonio
 from privy_cli.mapping_store import MappingData, MappingStoreError, read_mapping, write_mapping
 
 import pytest
@@ -19,3 +20,46 @@ def test_mapping_store_roundtrip(tmp_path: Path) -> None:
 def test_mapping_store_missing_file(tmp_path: Path) -> None:
     with pytest.raises(MappingStoreError):
         read_mapping(tmp_path / "does_not_exist.json")
+
+
+@pytest.mark.parametrize("content", [b"{not json", b"\xff\xfe{}"], ids=["syntax", "encoding"])
+def test_mapping_store_invalid_file(tmp_path: Path, content: bytes) -> None:
+    map_path = tmp_path / "mapping.json"
+    map_path.write_bytes(content)
+
+    with pytest.raises(MappingStoreError, match="not valid JSON"):
+        read_mapping(map_path)
+
+
+def _czech_mapping() -> MappingData:
+    mapping = MappingData.create_empty()
+    mapping.created_at = "2024-05-01T12:00:00+00:00"
+    mapping.placeholders["PERSON_001"] = {"label": "PERSON", "original": "Jiří Novák"}
+    mapping.placeholders["COMPANY_001"] = {"label": "COMPANY", "original": "Strojírny Vsetín s.r.o."}
+    return mapping
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_mapping_store_roundtrip_czech_text(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, use_orjson: bool) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+
+    mapping = _czech_mapping()
+    map_path = tmp_path / "mapping.json"
+    write_mapping(map_path, mapping)
+
+    assert "Jiří Novák" in map_path.read_text(encoding="utf-8")
+    assert read_mapping(map_path).placeholders == mapping.placeholders
+    assert jsonio.loads(jsonio.dumps(mapping.to_dict())) == mapping.to_dict()
+
+
+def test_jsonio_backends_write_identical_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("orjson")
+    payload = _czech_mapping().to_dict()
+    with_orjson = (jsonio.dumps_pretty(payload), jsonio.dumps(payload))
+
+    monkeypatch.setattr(jsonio, "orjson", None)
+
+    assert (jsonio.dumps_pretty(payload), jsonio.dumps(payload)) == with_orjson